@@ -223,7 +223,7 @@ class WebGazerDemo:
         # Save to JSON file for analysis
         analysis_file = self.data_dir / "webgazer_analysis_data.json"
         with open(analysis_file, 'w') as f:
-            json.dump(df_data, f, indent=2)
+            json.dump(df_data, f, separators=(',', ':'))
         
         # Run analysis
         results = analyze_session(self.session_id, analysis_file)
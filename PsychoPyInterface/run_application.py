@@ -710,17 +710,14 @@ class PsychoPyGazeTrackingApp:
             debug = self.config["web_interface"]["debug"]
             open_browser = self.config["web_interface"]["open_browser"]
             
-            # Check if port is available
-            if not self._is_port_available(host, port):
-                # Try to find an available port
-                for p in range(port + 1, port + 100):
-                    if self._is_port_available(host, p):
-                        self.logger.warning(f"Port {port} is not available. Using port {p} instead.")
-                        port = p
-                        break
-                else:
-                    self.logger.error(f"Could not find an available port. Web interface will not start.")
-                    return False
+            # Use the configured port, or the next available one
+            free_port = self._first_free_port(host, port, port + 100)
+            if free_port is None:
+                self.logger.error(f"Could not find an available port. Web interface will not start.")
+                return False
+            if free_port != port:
+                self.logger.warning(f"Port {port} is not available. Using port {free_port} instead.")
+                port = free_port
             
             # Open browser in a separate thread if requested
             if open_browser:
@@ -737,15 +734,39 @@ class PsychoPyGazeTrackingApp:
             self.logger.error(traceback.format_exc())
             return False
     
-    def _is_port_available(self, host, port):
-        """Check if a port is available."""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.bind((host, port))
-            sock.close()
-            return True
-        except:
-            return False
+    def _first_free_port(self, host, start, stop):
+        """
+        Find the first port in a range that can be bound.
+        
+        Parameters:
+        -----------
+        host : str
+            Host address to bind
+        start : int
+            First port to try
+        stop : int
+            End of the port range (exclusive)
+            
+        Returns:
+        --------
+        int or None
+            The first available port, or None if the whole range is taken
+        """
+        # One socket for the whole scan; a failed bind leaves it reusable
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            # On Windows SO_REUSEADDR lets bind() succeed on a port another process
+            # is listening on; SO_EXCLUSIVEADDRUSE makes busy ports fail as intended
+            if os.name == 'nt':
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            else:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            for port in range(start, stop):
+                try:
+                    sock.bind((host, port))
+                    return port
+                except OSError:
+                    continue
+        return None
     
     def cleanup(self):
         """Clean up resources."""
@@ -793,18 +814,36 @@ def load_config_file(config_path):
         logger.error(f"Error loading configuration file: {str(e)}")
         return None
 
-def main():
-    """Main entry point for the application."""
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description='PsychoPy GazeTracking Application')
-    parser.add_argument('--config', type=str, help='Path to configuration file')
-    parser.add_argument('--host', type=str, help='Host for web interface')
-    parser.add_argument('--port', type=int, help='Port for web interface')
-    parser.add_argument('--no-browser', action='store_true', help='Do not open browser automatically')
-    parser.add_argument('--fullscreen', action='store_true', help='Run in fullscreen mode')
-    parser.add_argument('--tracker', type=str, help='Tracker type (webcam, tobii, mouse, simulated)')
-    parser.add_argument('--webcam-id', type=int, help='Webcam ID for webcam tracker')
-    args = parser.parse_args()
+def main(**options):
+    """
+    Main entry point for the application.
+    
+    Parameters:
+    -----------
+    **options
+        Options matching the command line arguments (config, host, port,
+        no_browser, fullscreen, tracker, webcam_id). When given, the command
+        line is not parsed.
+    """
+    if options:
+        # Called from another launcher with already parsed options
+        args = argparse.Namespace(config=None, host=None, port=None, no_browser=False,
+                                  fullscreen=False, tracker=None, webcam_id=None)
+        for name, value in options.items():
+            if not hasattr(args, name):
+                raise TypeError(f"main() got an unexpected option '{name}'")
+            setattr(args, name, value)
+    else:
+        # Parse command line arguments
+        parser = argparse.ArgumentParser(description='PsychoPy GazeTracking Application')
+        parser.add_argument('--config', type=str, help='Path to configuration file')
+        parser.add_argument('--host', type=str, help='Host for web interface')
+        parser.add_argument('--port', type=int, help='Port for web interface')
+        parser.add_argument('--no-browser', action='store_true', help='Do not open browser automatically')
+        parser.add_argument('--fullscreen', action='store_true', help='Run in fullscreen mode')
+        parser.add_argument('--tracker', type=str, help='Tracker type (webcam, tobii, mouse, simulated)')
+        parser.add_argument('--webcam-id', type=int, help='Webcam ID for webcam tracker')
+        args = parser.parse_args()
     
     # Load configuration
     config = None
@@ -11,12 +11,13 @@ It handles error recovery, data validation, and comprehensive logging.
 import os
 import json
 import time
+import queue
 import numpy as np
 import logging
 from pathlib import Path
 from datetime import datetime
 from psychopy import core, visual, event, iohub
-from threading import Lock
+from threading import Lock, Thread
 
 # Try to import OpenCV, but handle case where it's not installed
 try:
@@ -79,19 +80,39 @@ class EyeTracker:
         Interval in seconds for automatic data saving (0 to disable)
     webcam_id : int
         Camera ID to use for webcam-based tracking (default: 0)
+    stream_to_disk : bool
+        Stream samples to a .npy file in the data directory while recording,
+        one file per recording, so that a crash does not lose the session
+        (default: True)
     """
     
     SUPPORTED_TRACKERS = ['psychopy', 'webgazer', 'tobii', 'eyelink', 'webcam', 'mouse']
     
+    # Columns of the sample buffer and of the arrays written to the stream file
+    SAMPLE_COLUMNS = ('timestamp', 'x', 'y', 'pupil_left', 'pupil_right', 'confidence')
+    INITIAL_BUFFER_SIZE = 1 << 16
+    STREAM_BATCH_SIZE = 256
+    
+    # Canonical calibration grids in normalized coordinates, the 9-point grid
+    # row-major from top-left
+    _GRID9 = np.array([(x, y) for y in (0.8, 0.0, -0.8) for x in (-0.8, 0.0, 0.8)])
+    _GRID5 = np.array([(0, 0), (-0.8, 0.8), (0.8, 0.8), (-0.8, -0.8), (0.8, -0.8)])
+    
+    # The 9-point grid ordered so that any prefix stays centred and balanced:
+    # centre, opposite corner pairs, then opposite edge midpoint pairs
+    _GRID9_CENTRE_FIRST = np.array([(0, 0), (-0.8, 0.8), (0.8, -0.8), (0.8, 0.8), (-0.8, -0.8),
+                                    (0, 0.8), (0, -0.8), (-0.8, 0), (0.8, 0)])
+    
     def __init__(self, window, tracker_type='psychopy', calibration_points=9, 
                  data_dir=None, validation_level='basic', auto_save_interval=60.0,
-                 webcam_id=0):
+                 webcam_id=0, stream_to_disk=True):
         self.window = window
         self.tracker_type = tracker_type.lower()
         self.calibration_points = calibration_points
         self.validation_level = validation_level
         self.auto_save_interval = auto_save_interval
         self.webcam_id = webcam_id
+        self.stream_to_disk = stream_to_disk
         
         if self.tracker_type not in self.SUPPORTED_TRACKERS:
             logger.error(f"Unsupported tracker type: {self.tracker_type}")
@@ -106,14 +127,26 @@ class EyeTracker:
             os.makedirs(self.data_dir)
             logger.info(f"Created data directory: {self.data_dir}")
             
-        # Initialize data storage with thread safety
-        self.gaze_data = []
+        # Initialize data storage with thread safety. Samples are stored as rows
+        # of a preallocated array (see SAMPLE_COLUMNS, NaN for missing values)
+        self._buf = np.empty((self.INITIAL_BUFFER_SIZE, len(self.SAMPLE_COLUMNS)))
+        self._n = 0
+        
+        # Index of the next WebGazer bridge sample to read
+        self._webgazer_next = 0
         self.data_lock = Lock()
         self.is_recording = False
         self.tracker = None
         self.last_auto_save = time.time()
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # Background writer that streams sample batches to disk while recording
+        self._writer_q = queue.SimpleQueue()
+        self._writer_thread = None
+        self._stream_file = None
+        self._streamed = 0
+        self._recording_index = 0
+        
         # Data validation parameters
         self.min_pupil_size = 1.0  # mm
         self.max_pupil_size = 9.0  # mm
@@ -121,6 +154,14 @@ class EyeTracker:
         self.last_valid_gaze = (0, 0)
         self.last_timestamp = 0
         
+        # Window geometry used to convert tracker coordinates on every sample
+        self._cache_window_geometry()
+        
+        # Calibration/validation stimuli, created on first use and reused
+        self._calib_target = None
+        self._calib_inner = None
+        self._calib_text = None
+        
         # Performance metrics
         self.sample_count = 0
         self.dropped_samples = 0
@@ -145,6 +186,62 @@ class EyeTracker:
             logger.error(f"Failed to initialize mouse fallback: {e}", exc_info=True)
             raise RuntimeError("Could not initialize eye tracker or mouse fallback")
         
+    def _cache_window_geometry(self):
+        """Cache the window size and half-extents used by the per-sample conversions."""
+        self._win_width, self._win_height = self.window.size
+        self._half_win_width = self._win_width * 0.5
+        self._half_win_height = self._win_height * 0.5
+        
+        # Affine map from display-normalized (0-1, y down) to window coordinates,
+        # applied to whole batches of samples: window = display * scale + offset
+        self._display_scale = np.array([self._win_width, -self._win_height])
+        self._display_offset = np.array([-self._half_win_width, self._half_win_height])
+        
+    def _get_calibration_stimuli(self, color, text, text_pos=(0, 0), text_height=0.05):
+        """
+        Get the shared calibration stimuli, creating them on first use.
+        
+        Building GratingStim/TextStim objects compiles shaders and uploads
+        textures, so the same objects are reused across calibration, validation
+        and retries; only their appearance is reset here.
+        
+        Parameters
+        ----------
+        color : str
+            Color of the outer target dot
+        text : str
+            Instruction text to display
+        text_pos : tuple
+            Position of the instruction text
+        text_height : float
+            Height of the instruction text
+            
+        Returns
+        -------
+        tuple
+            (target, inner_target, instructions) stimuli
+        """
+        if self._calib_target is None:
+            self._calib_target = visual.GratingStim(
+                self.window, tex=None, mask='circle', 
+                size=0.05, color=color
+            )
+            self._calib_inner = visual.GratingStim(
+                self.window, tex=None, mask='circle', 
+                size=0.01, color='white'
+            )
+            self._calib_text = visual.TextStim(
+                self.window, text=text, pos=text_pos, height=text_height
+            )
+        else:
+            self._calib_target.size = 0.05
+            self._calib_target.color = color
+            self._calib_text.text = text
+            self._calib_text.pos = text_pos
+            self._calib_text.height = text_height
+            
+        return self._calib_target, self._calib_inner, self._calib_text
+        
     def _initialize_tracker(self):
         """Initialize the appropriate eye tracker based on tracker_type."""
         if self.tracker_type == 'psychopy':
@@ -375,7 +472,11 @@ class EyeTracker:
         """Initialize WebGazer.js bridge."""
         try:
             from PsychoPyInterface.utils.webgazer_bridge import WebGazerBridge
-            self.tracker = WebGazerBridge(port=8887)
+            self.tracker = WebGazerBridge(
+                session_id=self.session_id,
+                port=8887,
+                auto_save_interval=self.auto_save_interval or None
+            )
             self.tracker.start()
             logger.info("WebGazer bridge initialized. Waiting for client connection...")
             
@@ -476,9 +577,8 @@ class EyeTracker:
                 return  # No valid gaze data
                 
             # Convert from normalized coordinates to window coordinates
-            win_size = self.window.size
-            screen_x = x * win_size[0] - win_size[0]/2
-            screen_y = (1-y) * win_size[1] - win_size[1]/2
+            screen_x = x * self._win_width - self._half_win_width
+            screen_y = (1-y) * self._win_height - self._half_win_height
             
             timestamp = gaze_data['device_time_stamp']
             
@@ -517,14 +617,14 @@ class EyeTracker:
             self.sample_count += 1
             
             # Add validated data
-            self.gaze_data.append({
-                'timestamp': timestamp,
-                'x': screen_x,
-                'y': screen_y,
-                'pupil_left': gaze_data['left_pupil_diameter'],
-                'pupil_right': gaze_data['right_pupil_diameter'],
-                'confidence': confidence
-            })
+            left_pupil = gaze_data['left_pupil_diameter']
+            right_pupil = gaze_data['right_pupil_diameter']
+            self._record_sample(
+                timestamp, screen_x, screen_y,
+                np.nan if left_pupil is None else left_pupil,
+                np.nan if right_pupil is None else right_pupil,
+                confidence
+            )
             
             # Auto-save if interval has elapsed
             if (self.auto_save_interval > 0 and 
@@ -533,7 +633,7 @@ class EyeTracker:
     
     def _auto_save_data(self):
         """Automatically save data at regular intervals."""
-        if len(self.gaze_data) > 0:
+        if self._n > 0:
             try:
                 backup_file = f"gaze_data_{self.session_id}_backup_{int(time.time())}.json"
                 self.save_data(backup_file)
@@ -620,11 +720,10 @@ class EyeTracker:
                     
                     # Show retry message
                     if attempt < max_attempts:
-                        retry_msg = visual.TextStim(
-                            self.window,
-                            text=f"Calibration failed. Attempt {attempt}/{max_attempts}\n\n"
-                                 f"Press SPACE to retry or ESC to skip calibration.",
-                            height=0.05
+                        _, _, retry_msg = self._get_calibration_stimuli(
+                            'red',
+                            f"Calibration failed. Attempt {attempt}/{max_attempts}\n\n"
+                            f"Press SPACE to retry or ESC to skip calibration."
                         )
                         
                         retry_msg.draw()
@@ -638,11 +737,10 @@ class EyeTracker:
                 logger.error(f"Error during calibration attempt {attempt}: {e}", exc_info=True)
                 
                 # Show error message
-                error_msg = visual.TextStim(
-                    self.window,
-                    text=f"Calibration error: {str(e)}\n\n"
-                         f"Press SPACE to retry or ESC to skip calibration.",
-                    height=0.05
+                _, _, error_msg = self._get_calibration_stimuli(
+                    'red',
+                    f"Calibration error: {str(e)}\n\n"
+                    f"Press SPACE to retry or ESC to skip calibration."
                 )
                 
                 error_msg.draw()
@@ -752,16 +850,11 @@ class EyeTracker:
             (0.8, -0.8)  # Bottom-right
         ]
         
-        target = visual.GratingStim(
-            self.window, tex=None, mask='circle', 
-            size=0.05, color='green'
-        )
-        
-        instructions = visual.TextStim(
-            self.window,
-            text="Look at each green dot to validate calibration",
-            pos=(0, 0.9),
-            height=0.04
+        target, _, instructions = self._get_calibration_stimuli(
+            'green',
+            "Look at each green dot to validate calibration",
+            text_pos=(0, 0.9),
+            text_height=0.04
         )
         
         errors = []
@@ -777,8 +870,8 @@ class EyeTracker:
                 
                 # Collect gaze data for the last 0.5 seconds
                 if frame >= 60:  # Last 0.5 seconds
-                    gaze = self.get_gaze_position()
-                    if gaze != (0, 0):
+                    gaze = self._get_gaze_normalized()
+                    if gaze is not None:
                         error = np.sqrt((gaze[0] - point[0])**2 + (gaze[1] - point[1])**2)
                         errors.append(error)
             
@@ -786,20 +879,10 @@ class EyeTracker:
         
         # Calculate average error
         if errors:
-            avg_error = sum(errors) / len(errors)
+            avg_error = np.mean(errors)
             logger.info(f"WebGazer validation average error: {avg_error:.4f}")
             
-            # Convert to visual degrees (approximate)
-            # Assuming a typical monitor setup
-            screen_width_cm = 50  # Approximate
-            viewing_distance_cm = 60  # Approximate
-            window_width_px = self.window.size[0]
-            
-            # Convert normalized coordinates to cm
-            error_cm = avg_error * screen_width_cm / 2
-            
-            # Convert to visual degrees
-            error_degrees = np.degrees(np.arctan(error_cm / viewing_distance_cm))
+            error_degrees = self._error_to_degrees(avg_error)
             
             logger.info(f"WebGazer validation error: {error_degrees:.2f} degrees visual angle")
             
@@ -808,64 +891,78 @@ class EyeTracker:
         
         return False
     
+    def _error_to_degrees(self, error):
+        """
+        Convert a gaze error in normalized units to degrees of visual angle.
+        
+        Parameters
+        ----------
+        error : float
+            Error in normalized window units (-1 to 1)
+            
+        Returns
+        -------
+        float
+            Approximate error in degrees of visual angle
+        """
+        # Assuming a typical monitor setup
+        screen_width_cm = 50  # Approximate
+        viewing_distance_cm = 60  # Approximate
+        
+        # Convert normalized coordinates to cm
+        error_cm = error * screen_width_cm / 2
+        
+        # Convert to visual degrees
+        return np.degrees(np.arctan(error_cm / viewing_distance_cm))
+    
+    def _calibration_grid(self, n_points):
+        """
+        Get calibration target positions.
+        
+        Parameters
+        ----------
+        n_points : int
+            Number of calibration points
+            
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (n, 2) with normalized (-1 to 1) positions. n equals
+            n_points up to 9; larger counts get the full square grid covering
+            them, so no row or column is left partly empty
+        """
+        if n_points == 9:
+            return self._GRID9.copy()
+        if n_points == 5:
+            return self._GRID5.copy()
+        if n_points < 9:
+            # Centre first, then balanced pairs of corners and edge midpoints
+            return self._GRID9_CENTRE_FIRST[:n_points].copy()
+        
+        # Larger counts: smallest square grid covering n_points, top row first
+        n = int(np.ceil(np.sqrt(n_points)))
+        xs = np.linspace(-0.8, 0.8, n)
+        xx, yy = np.meshgrid(xs, xs[::-1])
+        return np.stack((xx, yy), -1).reshape(-1, 2)
+    
     def _calibrate_tobii(self):
         """Calibrate Tobii eye tracker with interactive feedback and validation."""
         # Simple calibration procedure for Tobii
         if self.tracker_type != 'tobii':
             return False
             
-        # Create calibration points
-        points = []
-        for i in range(self.calibration_points):
-            if self.calibration_points == 9:
-                # 3x3 grid
-                row = i // 3
-                col = i % 3
-                x = -0.8 + col * 0.8
-                y = 0.8 - row * 0.8
-            elif self.calibration_points == 5:
-                # 5-point calibration
-                if i == 0:
-                    x, y = 0, 0  # Center
-                elif i == 1:
-                    x, y = -0.8, 0.8  # Top-left
-                elif i == 2:
-                    x, y = 0.8, 0.8  # Top-right
-                elif i == 3:
-                    x, y = -0.8, -0.8  # Bottom-left
-                else:
-                    x, y = 0.8, -0.8  # Bottom-right
-            else:
-                # Default to corners and center
-                if i == 0:
-                    x, y = 0, 0  # Center
-                elif i == 1:
-                    x, y = -0.8, 0.8  # Top-left
-                elif i == 2:
-                    x, y = 0.8, 0.8  # Top-right
-                elif i == 3:
-                    x, y = -0.8, -0.8  # Bottom-left
-                else:
-                    x, y = 0.8, -0.8  # Bottom-right
-                    
-            points.append((x, y))
+        # Create calibration points in normalized coordinates (-1 to 1)
+        grid = self._calibration_grid(self.calibration_points)
         
-        # Create visual stimuli
-        target = visual.GratingStim(
-            self.window, tex=None, mask='circle', 
-            size=0.05, color='red'
-        )
-        
-        inner_target = visual.GratingStim(
-            self.window, tex=None, mask='circle', 
-            size=0.01, color='white'
-        )
+        # Convert to screen coordinates (0 to 1, y down) for the tracker
+        screen_points = (grid * (0.5, -0.5) + 0.5).tolist()
+        points = grid.tolist()
         
-        instructions = visual.TextStim(
-            self.window, 
-            text="Follow the red dot with your eyes.\n\n"
-                 "Press SPACE to start calibration.",
-            height=0.05
+        # Get (cached) visual stimuli
+        target, inner_target, instructions = self._get_calibration_stimuli(
+            'red',
+            "Follow the red dot with your eyes.\n\n"
+            "Press SPACE to start calibration."
         )
         
         # Show instructions
@@ -880,11 +977,7 @@ class EyeTracker:
             # Enter calibration mode
             calibration.enter_calibration_mode()
             
-            for i, point in enumerate(points):
-                # Convert from normalized coordinates (-1 to 1) to screen coordinates (0 to 1)
-                screen_x = (point[0] + 1) / 2
-                screen_y = 1 - (point[1] + 1) / 2
-                
+            for point, (screen_x, screen_y) in zip(points, screen_points):
                 # Show point
                 target.pos = point
                 inner_target.pos = point
@@ -911,7 +1004,11 @@ class EyeTracker:
                 # Validate calibration
                 validation_result = self._validate_tobii_calibration(points)
                 
-                if validation_result:
+                # Validation shares the stimuli, so restore the calibration layout
+                _, _, instructions = self._get_calibration_stimuli('red', "")
+                
+                # Typical threshold for acceptable calibration is 1-2 degrees
+                if validation_result is not None and validation_result < 2.0:
                     instructions.text = "Calibration successful!\n\n" \
                                        f"Average error: {validation_result:.2f} degrees\n\n" \
                                        "Press SPACE to continue."
@@ -941,27 +1038,31 @@ class EyeTracker:
             return False
     
     def _validate_tobii_calibration(self, points):
-        """Validate Tobii calibration by measuring gaze accuracy at calibration points."""
-        target = visual.GratingStim(
-            self.window, tex=None, mask='circle', 
-            size=0.05, color='blue'
-        )
+        """
+        Validate Tobii calibration by measuring gaze accuracy at calibration points.
         
-        instructions = visual.TextStim(
-            self.window,
-            text="Validating calibration...\nPlease look at each blue dot",
-            pos=(0, 0.9),
-            height=0.04
+        Returns
+        -------
+        float or None
+            Average error in degrees of visual angle, or None if no valid gaze
+            samples were recorded
+        """
+        target, _, instructions = self._get_calibration_stimuli(
+            'blue',
+            "Validating calibration...\nPlease look at each blue dot",
+            text_pos=(0, 0.9),
+            text_height=0.04
         )
         
-        errors = []
+        errors = np.empty(len(points), dtype=np.float32)
         
         # Start recording for validation
         self.start_recording()
         
-        for point in points:
+        for i, point in enumerate(points):
             # Show point
             target.pos = point
+            first_sample = self._n
             
             for frame in range(90):  # 1.5 seconds at 60 Hz
                 target.draw()
@@ -972,13 +1073,9 @@ class EyeTracker:
                 if frame >= 60:  # Last 0.5 seconds
                     self.update()
             
-            # Calculate average error for this point
-            point_errors = []
+            # Calculate average error for this point from the samples shown it
             with self.data_lock:
-                # Calculate error for this point using gaze data
-                if self.gaze_data:
-                    # Process gaze data for this point
-                    point_errors.append(self.calculate_gaze_error(point))
+                errors[i] = self.calculate_gaze_error(point, first_sample)
             
             # Short pause between points
             core.wait(0.5)
@@ -986,28 +1083,45 @@ class EyeTracker:
         # Stop recording after validation
         self.stop_recording()
         
-        # Calculate average error across all points
-        if point_errors:
-            avg_error = sum(point_errors) / len(point_errors)
-            errors.append(avg_error)
-            
-        return errors
+        # Calculate average error across all points with valid samples
+        valid_errors = errors[~np.isnan(errors)]
+        if valid_errors.size == 0:
+            logger.warning("No valid gaze samples recorded during Tobii validation")
+            return None
+            
+        avg_error = valid_errors.mean()
+        logger.info(f"Tobii validation average error: {avg_error:.4f}")
         
-        # Show result
-        if calibration_result.status == tr.CALIBRATION_STATUS_SUCCESS:
-            instructions.text = "Calibration successful!\n\n" \
-                               "Press SPACE to continue."
-            success = True
-        else:
-            instructions.text = "Calibration failed. Please try again.\n\n" \
-                               "Press SPACE to continue."
-            success = False
+        return self._error_to_degrees(avg_error)
+    
+    def calculate_gaze_error(self, point, start=0, stop=None):
+        """
+        Calculate the mean distance between recorded gaze samples and a target.
+        
+        Parameters
+        ----------
+        point : tuple
+            (x, y) target position in normalized coordinates (-1 to 1)
+        start : int, optional
+            Index of the first recorded sample to compare (default: 0)
+        stop : int, optional
+            Index after the last sample to compare. If None, all samples
+            recorded so far are used.
             
-        instructions.draw()
-        self.window.flip()
-        event.waitKeys(keyList=['space'])
+        Returns
+        -------
+        float
+            Mean error in normalized units, or NaN if there are no samples
+        """
+        if stop is None:
+            stop = self._n
+        if stop <= start:
+            return np.nan
+            
+        # Gaze samples are in window coordinates centred on the screen
+        gaze = self._buf[start:stop, 1:3] / (self._half_win_width, self._half_win_height)
         
-        return success
+        return np.hypot(gaze[:, 0] - point[0], gaze[:, 1] - point[1]).mean()
     
     def _calibrate_eyelink(self):
         """Calibrate EyeLink eye tracker."""
@@ -1024,9 +1138,169 @@ class EyeTracker:
         # This is a placeholder and should be implemented based on the specific webcam calibration method
         return False
     
+    @property
+    def gaze_data(self):
+        """
+        Recorded gaze samples as a list of dictionaries.
+        
+        The list is built from the sample buffer on every access, so use it for
+        saving and analysis rather than in per-frame code.
+        """
+        samples = []
+        for timestamp, x, y, pupil_left, pupil_right, confidence in self._buf[:self._n].tolist():
+            sample = {
+                'timestamp': timestamp,
+                'x': None if np.isnan(x) else x,
+                'y': None if np.isnan(y) else y,
+                'pupil_left': None if np.isnan(pupil_left) else pupil_left,
+                'pupil_right': None if np.isnan(pupil_right) else pupil_right
+            }
+            if not np.isnan(confidence):
+                sample['confidence'] = confidence
+            samples.append(sample)
+        return samples
+    
+    def _record_sample(self, timestamp, x, y, pupil_left=np.nan, pupil_right=np.nan,
+                       confidence=np.nan):
+        """Store a gaze sample and queue full batches for the background disk writer."""
+        n = self._n
+        if n == len(self._buf):
+            self._grow_buffer(n + 1)
+        self._buf[n] = (timestamp, x, y, pupil_left, pupil_right, confidence)
+        self._n = n + 1
+        
+        if self._writer_thread is not None and self._n - self._streamed >= self.STREAM_BATCH_SIZE:
+            self._flush_stream_batch()
+    
+    def _record_samples(self, timestamps, positions):
+        """
+        Store a batch of gaze samples without pupil or confidence data.
+        
+        Parameters
+        ----------
+        timestamps : float or numpy.ndarray
+            Timestamp(s) of the samples
+        positions : numpy.ndarray
+            Array of shape (n_samples, 2) with window coordinates
+        """
+        n = self._n
+        n_samples = len(positions)
+        if n + n_samples > len(self._buf):
+            self._grow_buffer(n + n_samples)
+        rows = self._buf[n:n + n_samples]
+        rows[:, 0] = timestamps
+        rows[:, 1:3] = positions
+        rows[:, 3:] = np.nan
+        self._n = n + n_samples
+        
+        if self._writer_thread is not None and self._n - self._streamed >= self.STREAM_BATCH_SIZE:
+            self._flush_stream_batch()
+    
+    def _grow_buffer(self, min_size):
+        """Grow the sample buffer to hold at least min_size samples."""
+        size = len(self._buf)
+        while size < min_size:
+            size *= 2
+        buf = np.empty((size, self._buf.shape[1]))
+        buf[:self._n] = self._buf[:self._n]
+        self._buf = buf
+    
+    def _flush_stream_batch(self):
+        """Hand the samples not yet streamed to the writer thread as one array."""
+        if self._n > self._streamed:
+            self._writer_q.put(self._buf[self._streamed:self._n].copy())
+            self._streamed = self._n
+    
+    def _writer_loop(self, stream_file):
+        """Write queued sample batches to the stream file until a sentinel arrives."""
+        while True:
+            chunk = self._writer_q.get()
+            if chunk is None:
+                break
+            try:
+                np.save(stream_file, chunk)
+                stream_file.flush()
+            except Exception as e:
+                logger.error(f"Failed to stream gaze data to disk: {e}", exc_info=True)
+    
+    def _start_stream(self):
+        """Open a new stream file for this recording and start the writer thread."""
+        # Number the files so separate recordings (e.g. calibration validation
+        # and the experiment itself) never share a stream
+        filepath = self.data_dir / f"gaze_stream_{self.session_id}_{self._recording_index:03d}.npy"
+        self._recording_index += 1
+        try:
+            self._stream_file = open(filepath, 'ab')
+        except OSError as e:
+            logger.error(f"Could not open gaze stream file {filepath}: {e}")
+            return
+        
+        self._writer_thread = Thread(
+            target=self._writer_loop, args=(self._stream_file,), daemon=True
+        )
+        self._writer_thread.start()
+    
+    def _stop_stream(self):
+        """Flush pending samples, stop the writer thread and close the stream file."""
+        if self._writer_thread is None:
+            return
+        
+        with self.data_lock:
+            self._flush_stream_batch()
+            writer_thread, self._writer_thread = self._writer_thread, None
+        
+        self._writer_q.put(None)
+        writer_thread.join()
+        self._stream_file.close()
+        self._stream_file = None
+    
+    @staticmethod
+    def load_stream(filepath):
+        """
+        Load a gaze stream file written while recording.
+        
+        Parameters
+        ----------
+        filepath : str or Path
+            Path to a gaze_stream_*.npy file
+            
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (n_samples, 6) with columns given by SAMPLE_COLUMNS
+        """
+        chunks = []
+        with open(filepath, 'rb') as f:
+            while f.peek(1):
+                chunks.append(np.load(f))
+        
+        if not chunks:
+            return np.empty((0, len(EyeTracker.SAMPLE_COLUMNS)))
+        return np.concatenate(chunks)
+    
     def start_recording(self):
         """Start recording eye tracking data."""
-        self.gaze_data = []
+        # Pause the Tobii callback while a previous recording is wound up
+        self.is_recording = False
+        
+        # Finish any stream left open by a previous recording
+        self._stop_stream()
+        
+        # Reset under the lock so a sample being recorded by the callback
+        # thread cannot interleave with the reset or the new stream
+        with self.data_lock:
+            self._n = 0
+            self._streamed = 0
+            if self.stream_to_disk:
+                self._start_stream()
+            
+            # Only WebGazer samples received from now on belong to this recording
+            if self.tracker_type == 'webgazer' and hasattr(self.tracker, 'sample_count'):
+                self._webgazer_next = self.tracker.sample_count
+            
+            # The window may have been resized since the tracker was created
+            self._cache_window_geometry()
+        
         self.is_recording = True
         
         if self.tracker_type == 'psychopy':
@@ -1049,6 +1323,8 @@ class EyeTracker:
         elif self.tracker_type == 'eyelink':
             self.tracker.stopRecording()
         
+        self._stop_stream()
+        
         return True
     
     def get_gaze_position(self):
@@ -1057,19 +1333,48 @@ class EyeTracker:
         
         Returns
         -------
-        tuple
+        tuple or None
             (x, y) coordinates of gaze position, normalized to window size
+            (-1 to 1), or None if no gaze data is available
         """
         if self.tracker_type == 'webcam':
             return self._get_webcam_gaze()
+        return self._get_gaze_normalized()
+    
+    def _get_gaze_pixels(self):
+        """
+        Get the latest gaze position in window coordinates.
+        
+        Returns
+        -------
+        tuple or None
+            (x, y) in pixels from the window centre, or None if no gaze data
+            is available or the latest sample has no coordinates
+        """
         if not self.is_recording:
             self.update()
             
-        if len(self.gaze_data) > 0:
-            latest = self.gaze_data[-1]
-            return (latest['x'], latest['y'])
-        else:
-            return (0.5, 0.5)
+        if self._n == 0:
+            return None
+        x, y = self._buf[self._n - 1, 1:3].tolist()
+        if np.isnan(x) or np.isnan(y):
+            return None
+        return (x, y)
+    
+    def _get_gaze_normalized(self):
+        """
+        Get the latest gaze position in normalized coordinates.
+        
+        Returns
+        -------
+        tuple or None
+            (x, y) normalized to window size (-1 to 1), or None if no gaze
+            data is available
+        """
+        gaze = self._get_gaze_pixels()
+        if gaze is None:
+            return None
+        return (gaze[0] / self._half_win_width, gaze[1] / self._half_win_height)
     
     def update(self):
         """Update gaze data from the eye tracker."""
@@ -1093,33 +1398,18 @@ class EyeTracker:
             sample = self.tracker.getLastGazePosition()
             if sample is not None:
                 x, y = sample
-                timestamp = core.getTime()
-                self.gaze_data.append({
-                    'timestamp': timestamp,
-                    'x': x,
-                    'y': y,
-                    'pupil_left': None,
-                    'pupil_right': None
-                })
+                self._record_sample(core.getTime(), x, y)
     
     def _update_webgazer(self):
         """Update gaze data from WebGazer.js."""
-        if hasattr(self.tracker, 'get_latest_gaze_data'):
-            data = self.tracker.get_latest_gaze_data()
-            if data is not None:
+        if hasattr(self.tracker, 'get_gaze_samples'):
+            # Take every sample received since the last update as one batch
+            samples, self._webgazer_next = self.tracker.get_gaze_samples(self._webgazer_next)
+            if len(samples):
                 # Convert from normalized coordinates (0-1) to window coordinates
-                win_size = self.window.size
-                x = data['x'] * win_size[0] - win_size[0]/2
-                y = (1-data['y']) * win_size[1] - win_size[1]/2
-                
-                timestamp = data.get('timestamp', core.getTime())
-                self.gaze_data.append({
-                    'timestamp': timestamp,
-                    'x': x,
-                    'y': y,
-                    'pupil_left': None,
-                    'pupil_right': None
-                })
+                positions = np.column_stack((samples['x'], samples['y']))
+                positions = positions * self._display_scale + self._display_offset
+                self._record_samples(samples['timestamp'], positions)
     
     def _update_tobii(self):
         """Update gaze data from Tobii eye tracker."""
@@ -1141,15 +1431,8 @@ class EyeTracker:
     
     def _update_mouse(self):
         """Update gaze data using mouse position (simulation)."""
-        pos = self.tracker.getPos()
-        timestamp = core.getTime()
-        self.gaze_data.append({
-            'timestamp': timestamp,
-            'x': pos[0],
-            'y': pos[1],
-            'pupil_left': None,
-            'pupil_right': None
-        })
+        x, y = self.tracker.getPos()
+        self._record_sample(core.getTime(), x, y)
     
     def _get_webcam_gaze(self):
         """
@@ -1219,7 +1502,7 @@ class EyeTracker:
             logger.error(f"Error in webcam gaze tracking: {e}", exc_info=True)
             return (0.5, 0.5)  # Return center of screen as fallback
     
-    def save_data(self, filename=None):
+    def save_data(self, filename=None, pretty=False):
         """
         Save recorded gaze data to a file.
         
@@ -1227,6 +1510,9 @@ class EyeTracker:
         ----------
         filename : str, optional
             Name of the file to save data to. If None, a default name is generated.
+        pretty : bool, optional
+            Indent the JSON output for human inspection. Default is False, which
+            writes compact JSON (much faster and smaller for long recordings).
             
         Returns
         -------
@@ -1237,22 +1523,23 @@ class EyeTracker:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"gaze_data_{timestamp}.json"
         
+        # The data directory is created in __init__
         filepath = self.data_dir / filename
         
-        # Ensure data directory exists
-        if not self.data_dir.exists():
-            os.makedirs(self.data_dir)
-        
         # Save data
+        if pretty:
+            dump_kwargs = {'indent': 2}
+        else:
+            dump_kwargs = {'separators': (',', ':')}
         with open(filepath, 'w') as f:
             json.dump({
                 'tracker_type': self.tracker_type,
                 'timestamp': datetime.now().isoformat(),
                 'window_size': self.window.size,
                 'gaze_data': self.gaze_data
-            }, f, indent=2)
+            }, f, **dump_kwargs)
         
-        print(f"Gaze data saved to {filepath}")
+        logger.info(f"Gaze data saved to {filepath}")
         return str(filepath)
     
     def close(self):
@@ -9,19 +9,39 @@ via a websocket connection.
 
 import json
 import asyncio
+import logging
 import websockets
 import threading
 import time
+import numpy as np
 from pathlib import Path
 from datetime import datetime
 
 from ..config import DATA_DIR
 
+logger = logging.getLogger('WebGazerBridge')
+
+# orjson decodes the per-sample gaze messages several times faster than the
+# stdlib parser; fall back to json when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
 
 class WebGazerBridge:
     """Bridge between PsychoPy and WebGazer.js."""
 
-    def __init__(self, session_id=None, host="localhost", port=8765, save_locally=True):
+    # Per-sample storage layout; session id and screen size are kept once
+    # per session rather than per sample
+    RECORD_DTYPE = np.dtype([('timestamp', '<f8'), ('x', '<f8'), ('y', '<f8')])
+    INITIAL_BUFFER_SIZE = 1 << 16
+
+    def __init__(self, session_id=None, host="localhost", port=8765, save_locally=True,
+                 auto_save_interval=None):
         """
         Initialize the WebGazer bridge.
 
@@ -35,17 +55,39 @@ class WebGazerBridge:
             The websocket port. Default is 8765.
         save_locally : bool, optional
             Whether to save data locally. Default is True.
+        auto_save_interval : float, optional
+            If set, new data points are flushed to numbered NPZ chunk files
+            every this many seconds from a background thread, instead of in
+            one file when the bridge stops. Default is None.
         """
         self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.host = host
         self.port = port
         self.save_locally = save_locally
+        self.auto_save_interval = auto_save_interval
         self.server = None
         self.server_thread = None
+        self._loop = None
         self.is_running = False
         self.connected_clients = set()
-        self.gaze_data = []
         self.on_gaze_callback = None
+        
+        # Gaze samples, appended by the server thread
+        self._records = np.empty(self.INITIAL_BUFFER_SIZE, dtype=self.RECORD_DTYPE)
+        self._n = 0
+        self.screen_width = None
+        self.screen_height = None
+        
+        self._session_dir = None
+        self._client_html_cache = {}
+        
+        # Background chunk writer state
+        self._writer_thread = None
+        self._writer_stop = threading.Event()
+        self._saved = 0
+        # Numbers the chunk files; not reset on restart, since the session
+        # directory is the same and earlier chunks must not be overwritten
+        self._chunk_index = 0
 
     async def _handle_client(self, websocket, path):
         """
@@ -69,26 +111,22 @@ class WebGazerBridge:
             # Handle messages from client
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = _json_loads(message)
                     if data.get("type") == "gaze_data":
                         # Process gaze data
-                        gaze_point = {
-                            "timestamp": time.time(),
-                            "x": data.get("x"),
-                            "y": data.get("y"),
-                            "session_id": self.session_id,
-                            "screen_width": data.get("screen_width"),
-                            "screen_height": data.get("screen_height")
-                        }
-                        
-                        self.gaze_data.append(gaze_point)
+                        timestamp = time.time()
+                        x = data.get("x")
+                        y = data.get("y")
+                        self.screen_width = data.get("screen_width", self.screen_width)
+                        self.screen_height = data.get("screen_height", self.screen_height)
+                        self._append_record(timestamp, x, y)
                         
                         # Call callback if registered
                         if self.on_gaze_callback:
-                            self.on_gaze_callback(gaze_point)
+                            self.on_gaze_callback(self._make_gaze_point(timestamp, x, y))
                     
                 except json.JSONDecodeError:
-                    print(f"Invalid JSON received: {message}")
+                    logger.debug(f"Invalid JSON received: {message}")
         
         finally:
             self.connected_clients.remove(websocket)
@@ -103,40 +141,63 @@ class WebGazerBridge:
             self.server = await websockets.serve(
                 self._handle_client, self.host, self.port
             )
-            print(f"WebGazer bridge server started at ws://{self.host}:{self.port}")
+            logger.info(f"WebGazer bridge server started at ws://{self.host}:{self.port}")
             await self.server.wait_closed()
         
         # Run server in a separate thread
         def run_asyncio_loop():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
+            self._loop = loop
             loop.run_until_complete(run_server())
         
         self.server_thread = threading.Thread(target=run_asyncio_loop, daemon=True)
         self.server_thread.start()
         self.is_running = True
-        self.gaze_data = []
+        self._n = 0
+        self._saved = 0
+        
+        # Create the session directory once for all local saves
+        if self.save_locally:
+            self._session_dir = DATA_DIR / self.session_id
+            self._session_dir.mkdir(parents=True, exist_ok=True)
+        
+        if self.save_locally and self.auto_save_interval:
+            self._writer_stop.clear()
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
 
     def stop(self):
         """Stop the WebGazer bridge server."""
         if not self.is_running:
             return
         
-        # Close all client connections
-        if self.connected_clients:
-            asyncio.run(self._close_connections())
-        
-        # Close server
-        if self.server:
-            self.server.close()
-            asyncio.run(self.server.wait_closed())
+        # Close client connections and the server on the server's own event loop
+        if self._loop is not None and self._loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+            try:
+                future.result(timeout=5.0)
+            except Exception as e:
+                logger.warning(f"Error shutting down WebGazer bridge server: {e}")
         
         self.is_running = False
         
         # Save data
-        if self.save_locally and self.gaze_data:
+        if self._writer_thread is not None:
+            # The writer flushes whatever is left before exiting
+            self._writer_stop.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+        elif self.save_locally and self._n:
             self._save_data_locally()
 
+    async def _shutdown(self):
+        """Close all client connections and the server."""
+        await self._close_connections()
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+
     async def _close_connections(self):
         """Close all client connections."""
         if not self.connected_clients:
@@ -146,22 +207,74 @@ class WebGazerBridge:
         await asyncio.gather(*close_tasks, return_exceptions=True)
 
     def _save_data_locally(self):
-        """Save recorded data to a local file."""
-        if not self.gaze_data:
+        """
+        Save recorded data to a local file.
+
+        Gaze samples are written column-wise to a compressed NPZ archive
+        (``timestamp``, ``x``, ``y``), with the session metadata in a small
+        JSON sidecar next to it.
+        """
+        if not self._n:
             return
-            
-        # Create session directory
-        session_dir = DATA_DIR / self.session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save data to JSON file
+        # Snapshot the samples, the server thread may still append
+        samples = self._snapshot(0)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = session_dir / f"webgazer_data_{timestamp}.json"
+        filename = self._write_samples(samples, f"webgazer_data_{timestamp}.npz")
         
-        with open(filename, 'w') as f:
-            json.dump(self.gaze_data, f, indent=2)
-            
-        print(f"Saved {len(self.gaze_data)} WebGazer data points to {filename}")
+        logger.info(f"Saved {len(samples)} WebGazer data points to {filename}")
+
+    def _writer_loop(self):
+        """Flush new data points to chunk files until the bridge stops."""
+        while not self._writer_stop.wait(self.auto_save_interval):
+            self._flush_chunk()
+        self._flush_chunk()
+
+    def _flush_chunk(self):
+        """Write the data points received since the last flush to a chunk file."""
+        end = self._n
+        if end <= self._saved:
+            return
+        
+        samples = self._snapshot(self._saved, end)
+        try:
+            self._write_samples(samples, f"webgazer_chunk_{self._chunk_index:04d}.npz")
+        except Exception as e:
+            logger.error(f"Error saving WebGazer data chunk: {e}")
+            return
+        self._saved = end
+        self._chunk_index += 1
+
+    def _write_samples(self, samples, name):
+        """
+        Write data points to a compressed NPZ file in the session directory.
+
+        Parameters
+        ----------
+        samples : numpy.ndarray
+            Gaze records to write.
+        name : str
+            File name of the archive.
+
+        Returns
+        -------
+        pathlib.Path
+            Path of the written archive.
+        """
+        filename = self._session_dir / name
+        np.savez_compressed(filename, timestamp=samples['timestamp'],
+                            x=samples['x'], y=samples['y'])
+        
+        meta = {
+            "session_id": self.session_id,
+            "screen_width": self.screen_width,
+            "screen_height": self.screen_height,
+            "n_samples": len(samples)
+        }
+        with open(filename.with_suffix('.meta.json'), 'w') as f:
+            json.dump(meta, f, separators=(',', ':'))
+        
+        return filename
 
     def send_message(self, message_type, data=None):
         """
@@ -174,7 +287,7 @@ class WebGazerBridge:
         data : dict, optional
             Additional data to include in the message.
         """
-        if not self.is_running or not self.connected_clients:
+        if not self.is_running or not self.connected_clients or self._loop is None:
             return
         
         message = {
@@ -184,13 +297,18 @@ class WebGazerBridge:
         if data:
             message.update(data)
         
-        # Send message to all clients
-        asyncio.run(self._broadcast_message(json.dumps(message)))
+        # Hand the send to the server's event loop instead of blocking the caller
+        # (e.g. the experiment's frame loop) until every client has received it
+        self._loop.call_soon_threadsafe(self._broadcast_message, json.dumps(message))
 
-    async def _broadcast_message(self, message):
+    def _broadcast_message(self, message):
         """
         Broadcast a message to all connected clients.
 
+        Must run on the server's event loop. websockets.broadcast writes the
+        frame to each connection without awaiting, so no task is created per
+        client and slow clients are skipped rather than waited for.
+
         Parameters
         ----------
         message : str
@@ -199,8 +317,104 @@ class WebGazerBridge:
         if not self.connected_clients:
             return
         
-        send_tasks = [client.send(message) for client in self.connected_clients]
-        await asyncio.gather(*send_tasks, return_exceptions=True)
+        websockets.broadcast(self.connected_clients, message)
+
+    def is_connected(self):
+        """
+        Check whether at least one client is connected.
+
+        Returns
+        -------
+        bool
+            True if a WebGazer client is connected.
+        """
+        return bool(self.connected_clients)
+
+    def get_latest_gaze_data(self):
+        """
+        Get the most recent gaze data point received from a client.
+
+        Returns
+        -------
+        dict or None
+            The latest gaze data point, or None if no data has been received.
+        """
+        n = self._n
+        if n == 0:
+            return None
+        record = self._records[n - 1]
+        return self._make_gaze_point(*record.tolist())
+
+    def get_gaze_samples(self, start=0):
+        """
+        Get all gaze data points received since a given index.
+
+        Parameters
+        ----------
+        start : int, optional
+            Index of the first data point to return. Default is 0.
+
+        Returns
+        -------
+        tuple
+            (samples, next_index) where samples is a structured array with
+            fields timestamp, x and y, and next_index is the index to pass on
+            the next call.
+        """
+        # Snapshot the length, the server thread may append concurrently
+        end = self._n
+        return self._snapshot(start, end), end
+
+    @property
+    def sample_count(self):
+        """int: Number of gaze data points received since the bridge started."""
+        return self._n
+
+    @property
+    def gaze_data(self):
+        """
+        list: Recorded gaze data points as dictionaries.
+
+        Built on access from the record buffer; prefer get_gaze_samples for
+        bulk processing.
+        """
+        return [self._make_gaze_point(*record)
+                for record in self._snapshot(0).tolist()]
+
+    def _append_record(self, timestamp, x, y):
+        """Append one gaze sample to the record buffer, growing it if full."""
+        n = self._n
+        if n == len(self._records):
+            # Copy before swapping so readers always see complete rows
+            grown = np.empty(2 * n, dtype=self.RECORD_DTYPE)
+            grown[:n] = self._records[:n]
+            self._records = grown
+        self._records[n] = (timestamp,
+                            np.nan if x is None else x,
+                            np.nan if y is None else y)
+        self._n = n + 1
+
+    def _snapshot(self, start, end=None):
+        """Copy records [start, end) out of the buffer."""
+        if end is None:
+            end = self._n
+        return self._records[start:end].copy()
+
+    def _make_gaze_point(self, timestamp, x, y):
+        """Build the dictionary form of a gaze sample."""
+        # Missing coordinates are stored as NaN; report them as None again
+        if x is not None and np.isnan(x):
+            x = None
+        if y is not None and np.isnan(y):
+            y = None
+        return {
+            "timestamp": timestamp,
+            "x": x,
+            "y": y,
+            "session_id": self.session_id,
+            "screen_width": self.screen_width,
+            "screen_height": self.screen_height
+        }
 
     def register_gaze_callback(self, callback):
         """
@@ -218,11 +432,22 @@ class WebGazerBridge:
         """
         Get HTML code for the client to connect to the WebGazer bridge.
 
+        The page is rendered once per session, host and port.
+
         Returns
         -------
         str
             HTML code for the client.
         """
+        key = (self.session_id, self.host, self.port)
+        html = self._client_html_cache.get(key)
+        if html is None:
+            html = self._render_client_html()
+            self._client_html_cache[key] = html
+        return html
+
+    def _render_client_html(self):
+        """Render the client HTML for the current host and port."""
         html = f"""
         <!DOCTYPE html>
         <html lang="en">
@@ -517,5 +742,5 @@ class WebGazerBridge:
         with open(filename, 'w') as f:
             f.write(self.get_client_html())
         
-        print(f"Saved WebGazer client HTML to {filename}")
+        logger.info(f"Saved WebGazer client HTML to {filename}")
         return filename 
\ No newline at end of file
@@ -9,7 +9,9 @@ depend on PsychoPy for the web server functionality.
 
 import os
 import sys
+import copy
 import json
+import hashlib
 import logging
 import argparse
 import webbrowser
@@ -19,6 +21,7 @@ from datetime import datetime
 from pathlib import Path
 import socket
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -39,10 +42,46 @@ except ImportError:
     FLASK_AVAILABLE = False
     sys.exit(1)
 
+# orjson encodes API responses and decodes config files in C; fall back to
+# the stdlib/Flask encoders when it is not installed
+try:
+    import orjson
+    from flask import current_app
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    def _jsonify(obj):
+        """Build a JSON response for obj using orjson."""
+        return current_app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+            mimetype='application/json'
+        )
+    _json_loads = orjson.loads
+else:
+    _jsonify = jsonify
+    _json_loads = json.loads
+
 # Check for optional dependencies
+try:
+    import waitress
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+# Simulated data is drawn in batches from a NumPy generator when available
 try:
     import numpy as np
+    _rng = np.random.default_rng()
+except ImportError:
+    _rng = None
+
+try:
+    import matplotlib
+    matplotlib.use('Agg')
     import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
     from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
     import io
     import base64
@@ -51,6 +90,9 @@ except ImportError:
     logger.warning("Visualization libraries not found. Visualization features will be limited.")
     VISUALIZATION_AVAILABLE = False
 
+# Number of simulated gaze points drawn per refill
+GAZE_BUFFER_SIZE = 4096
+
 try:
     import cv2
     OPENCV_AVAILABLE = True
@@ -58,6 +100,15 @@ except ImportError:
     logger.warning("OpenCV not found. Webcam-based tracking will not be available.")
     OPENCV_AVAILABLE = False
 
+# Seconds a webcam scan result is reused by /api/webcam_list
+WEBCAM_CACHE_TTL = 30.0
+
+# Pre-encoded /api/gaze_data response, filled with x, y and timestamp
+_GAZE_TEMPLATE = (
+    b'{"status":"success","data":{"x":%.6f,"y":%.6f,"timestamp":%.6f,'
+    b'"confidence":0.95,"valid":true,"simulated":true}}'
+)
+
 # Application configuration
 DEFAULT_CONFIG = {
     "web_interface": {
@@ -85,6 +136,61 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Accepted configuration keys and the type each value must have; lists hold
+# integers (RGB colors) and ints are accepted where a float is expected
+_CONFIG_SCHEMA = {
+    "web_interface": {
+        "host": str,
+        "port": int,
+        "debug": bool,
+        "open_browser": bool
+    },
+    "experiment": {
+        "fullscreen": bool,
+        "screen_width": int,
+        "screen_height": int,
+        "background_color": list,
+        "text_color": list
+    },
+    "eye_tracking": {
+        "tracker_type": str,
+        "webcam_id": int,
+        "calibration_points": int,
+        "validation_threshold": float
+    },
+    "data": {
+        "save_directory": str,
+        "auto_save_interval": float
+    }
+}
+
+def _is_valid_config_value(value, expected):
+    """
+    Check a configuration value against the type given in _CONFIG_SCHEMA.
+    
+    Parameters:
+    -----------
+    value : object
+        Value from a user-provided configuration
+    expected : type
+        Type the value must have
+        
+    Returns:
+    --------
+    bool
+        True if the value can be stored as is
+    """
+    # bool is a subclass of int, but True is not a valid port or count
+    if isinstance(value, bool):
+        return expected is bool
+    if expected is float:
+        return isinstance(value, (int, float))
+    if expected is list:
+        return isinstance(value, list) and all(
+            isinstance(item, int) and not isinstance(item, bool) for item in value
+        )
+    return isinstance(value, expected)
+
 class MinimalApp:
     """Minimal web application for PsychoPy GazeTracking."""
     
@@ -97,7 +203,7 @@ class MinimalApp:
         config : dict, optional
             Configuration dictionary. If None, default config will be used.
         """
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(DEFAULT_CONFIG)
         if config:
             self._update_config(config)
             
@@ -108,6 +214,25 @@ class MinimalApp:
         # Initialize state variables
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # Calibration visualization state: the simulated results, the figure
+        # reused for rendering and the rendered PNGs keyed by result hash
+        self._calibration_points = None
+        self._viz_cache = {}
+        self._viz_figure = None
+        self._viz_lock = threading.Lock()
+        
+        # Pre-drawn simulated gaze points, consumed one per /api/gaze_data call
+        self._gaze_buf = None
+        self._gaze_i = 0
+        self._gaze_lock = threading.Lock()
+        
+        # Dependency checks are resolved once on first use
+        self._psychopy_available = None
+        self._local_modules_available = None
+        
+        # (detection time, webcams) from the last webcam scan
+        self._webcam_cache = None
+        
         # Initialize Flask app
         self.flask_app = None
         if FLASK_AVAILABLE:
@@ -121,15 +246,36 @@ class MinimalApp:
         -----------
         config : dict
             Configuration dictionary to merge with defaults
+            
+        Raises:
+        -------
+        ValueError
+            If the configuration contains unknown keys or invalid values
         """
+        if not isinstance(config, dict):
+            raise ValueError("Configuration must be an object")
+        
+        # Validate everything first so a bad update changes nothing
+        updates = []
         for section, values in config.items():
-            if section in self.config:
-                if isinstance(self.config[section], dict) and isinstance(values, dict):
-                    self.config[section].update(values)
-                else:
-                    self.config[section] = values
-            else:
-                self.config[section] = values
+            schema = _CONFIG_SCHEMA.get(section)
+            if schema is None:
+                raise ValueError(f"Unknown configuration section: {section}")
+            if not isinstance(values, dict):
+                raise ValueError(f"Configuration section '{section}' must be an object")
+            for key, value in values.items():
+                expected = schema.get(key)
+                if expected is None:
+                    raise ValueError(f"Unknown configuration key: {section}.{key}")
+                if not _is_valid_config_value(value, expected):
+                    raise ValueError(f"Invalid value for {section}.{key}: {value!r} "
+                                     f"(expected {expected.__name__})")
+                if expected is float:
+                    value = float(value)
+                updates.append((section, key, value))
+        
+        for section, key, value in updates:
+            self.config[section][key] = value
     
     def _setup_flask_app(self):
         """Set up Flask web application."""
@@ -149,7 +295,7 @@ class MinimalApp:
         
         @self.flask_app.route('/api/status')
         def status():
-            return jsonify({
+            return _jsonify({
                 'psychopy_available': self._check_psychopy(),
                 'opencv_available': OPENCV_AVAILABLE,
                 'visualization_available': VISUALIZATION_AVAILABLE,
@@ -167,113 +313,74 @@ class MinimalApp:
                 try:
                     new_config = request.json
                     self._update_config(new_config)
-                    return jsonify({'status': 'success', 'config': self.config})
+                    return _jsonify({'status': 'success', 'config': self.config})
                 except Exception as e:
-                    return jsonify({'status': 'error', 'message': str(e)}), 400
+                    return _jsonify({'status': 'error', 'message': str(e)}), 400
             else:
-                return jsonify(self.config)
+                return _jsonify(self.config)
         
         @self.flask_app.route('/api/initialize', methods=['POST'])
         def initialize():
-            return jsonify({
+            return _jsonify({
                 'status': 'error', 
                 'message': 'This is a minimal web interface. PsychoPy functionality is not available.'
             }), 400
         
         @self.flask_app.route('/api/calibrate', methods=['POST'])
         def calibrate():
-            return jsonify({
+            return _jsonify({
                 'status': 'error', 
                 'message': 'This is a minimal web interface. PsychoPy functionality is not available.'
             }), 400
         
         @self.flask_app.route('/api/validate', methods=['POST'])
         def validate():
-            return jsonify({
+            return _jsonify({
                 'status': 'error', 
                 'message': 'This is a minimal web interface. PsychoPy functionality is not available.'
             }), 400
         
         @self.flask_app.route('/api/experiment/start', methods=['POST'])
         def start_experiment():
-            return jsonify({
+            return _jsonify({
                 'status': 'error', 
                 'message': 'This is a minimal web interface. PsychoPy functionality is not available.'
             }), 400
         
         @self.flask_app.route('/api/experiment/stop', methods=['POST'])
         def stop_experiment():
-            return jsonify({
+            return _jsonify({
                 'status': 'error', 
                 'message': 'This is a minimal web interface. PsychoPy functionality is not available.'
             }), 400
         
         @self.flask_app.route('/api/gaze_data', methods=['GET'])
         def get_gaze_data():
-            # Return simulated gaze data
-            import random
-            return jsonify({
-                'status': 'success', 
-                'data': {
-                    'x': random.uniform(-1, 1),
-                    'y': random.uniform(-1, 1),
-                    'timestamp': time.time(),
-                    'confidence': 0.95,
-                    'valid': True,
-                    'simulated': True
-                }
-            })
+            # Return simulated gaze data; only the numbers change per call
+            x, y = self._next_simulated_gaze()
+            body = _GAZE_TEMPLATE % (x, y, time.time())
+            return self.flask_app.response_class(body, mimetype='application/json')
         
         @self.flask_app.route('/api/visualization/calibration', methods=['GET'])
         def get_calibration_visualization():
             if not VISUALIZATION_AVAILABLE:
-                return jsonify({
+                return _jsonify({
                     'status': 'error', 
                     'message': 'Visualization not available'
                 }), 400
                 
             try:
-                # Generate a simple visualization
-                fig = plt.figure(figsize=(10, 8))
-                
-                # Plot some random points
-                ax = fig.add_subplot(111)
-                
-                # Generate random target and gaze points
-                import random
-                target_points = [(random.uniform(-0.8, 0.8), random.uniform(-0.8, 0.8)) for _ in range(9)]
-                gaze_points = [(x + random.uniform(-0.1, 0.1), y + random.uniform(-0.1, 0.1)) 
-                              for x, y in target_points]
-                
-                # Extract x and y coordinates
-                target_x = [p[0] for p in target_points]
-                target_y = [p[1] for p in target_points]
-                gaze_x = [p[0] for p in gaze_points]
-                gaze_y = [p[1] for p in gaze_points]
-                
-                # Plot points
-                ax.scatter(target_x, target_y, color='blue', label='Target', s=100)
-                ax.scatter(gaze_x, gaze_y, color='red', alpha=0.7, label='Gaze', s=50)
+                target_points, gaze_points = self._get_calibration_points()
+                key = hashlib.blake2b(target_points.tobytes() + gaze_points.tobytes(),
+                                      digest_size=8).hexdigest()
                 
-                # Draw lines connecting corresponding points
-                for i in range(len(target_x)):
-                    ax.plot([target_x[i], gaze_x[i]], [target_y[i], gaze_y[i]], 'k-', alpha=0.3)
+                with self._viz_lock:
+                    img_data = self._viz_cache.get(key)
+                    if img_data is None:
+                        img_data = self._render_calibration(target_points, gaze_points)
+                        self._viz_cache[key] = img_data
                 
-                ax.set_title('Simulated Calibration Results')
-                ax.set_xlabel('X Coordinate')
-                ax.set_ylabel('Y Coordinate')
-                ax.legend()
-                ax.grid(True, alpha=0.3)
-                
-                # Convert plot to image
-                canvas = FigureCanvas(fig)
-                img_io = io.BytesIO()
-                canvas.print_png(img_io)
-                img_io.seek(0)
-                img_data = base64.b64encode(img_io.getvalue()).decode('utf-8')
-                plt.close(fig)
-                
-                return jsonify({
+                return _jsonify({
                     'status': 'success', 
                     'image': f'data:image/png;base64,{img_data}',
                     'metrics': {
@@ -285,34 +392,121 @@ class MinimalApp:
             except Exception as e:
                 logger.error(f"Error generating visualization: {str(e)}")
                 logger.error(traceback.format_exc())
-                return jsonify({'status': 'error', 'message': str(e)}), 500
+                return _jsonify({'status': 'error', 'message': str(e)}), 500
         
         @self.flask_app.route('/api/webcam_list', methods=['GET'])
         def get_webcam_list():
             if not OPENCV_AVAILABLE:
-                return jsonify({'status': 'error', 'message': 'OpenCV not available'}), 400
+                return _jsonify({'status': 'error', 'message': 'OpenCV not available'}), 400
                 
             try:
                 webcams = self._detect_webcams()
-                return jsonify({'status': 'success', 'webcams': webcams})
+                return _jsonify({'status': 'success', 'webcams': webcams})
             except Exception as e:
-                return jsonify({'status': 'error', 'message': str(e)}), 500
+                return _jsonify({'status': 'error', 'message': str(e)}), 500
+    
+    def _next_simulated_gaze(self):
+        """
+        Get the next simulated gaze position.
+        
+        Returns:
+        --------
+        tuple
+            (x, y) in normalized coordinates (-1 to 1)
+        """
+        if _rng is None:
+            import random
+            return random.uniform(-1, 1), random.uniform(-1, 1)
+        
+        with self._gaze_lock:
+            if self._gaze_buf is None or self._gaze_i == len(self._gaze_buf):
+                self._gaze_buf = _rng.uniform(-1, 1, size=(GAZE_BUFFER_SIZE, 2)).tolist()
+                self._gaze_i = 0
+            x, y = self._gaze_buf[self._gaze_i]
+            self._gaze_i += 1
+        return x, y
+    
+    def _get_calibration_points(self):
+        """
+        Get the simulated calibration results.
+        
+        The points are generated once per session so the rendered
+        visualization can be cached.
+        
+        Returns:
+        --------
+        tuple
+            (target_points, gaze_points) as (n_points, 2) arrays
+        """
+        if self._calibration_points is None:
+            target_points = _rng.uniform(-0.8, 0.8, size=(9, 2))
+            gaze_points = target_points + _rng.uniform(-0.1, 0.1, size=(9, 2))
+            self._calibration_points = (target_points, gaze_points)
+        return self._calibration_points
+    
+    def _render_calibration(self, target_points, gaze_points):
+        """
+        Render calibration results to a base64-encoded PNG.
+        
+        Parameters:
+        -----------
+        target_points : numpy.ndarray
+            Calibration target positions, shape (n_points, 2)
+        gaze_points : numpy.ndarray
+            Measured gaze positions, shape (n_points, 2)
+            
+        Returns:
+        --------
+        str
+            Base64-encoded PNG image
+        """
+        # Reuse a single figure instead of building one per request
+        if self._viz_figure is None:
+            self._viz_figure = plt.figure(figsize=(10, 8))
+        fig = self._viz_figure
+        fig.clear()
+        
+        ax = fig.add_subplot(111)
+        
+        # Plot points
+        ax.scatter(target_points[:, 0], target_points[:, 1], color='blue', label='Target', s=100)
+        ax.scatter(gaze_points[:, 0], gaze_points[:, 1], color='red', alpha=0.7, label='Gaze', s=50)
+        
+        # Draw lines connecting corresponding points as one (n_points, 2, 2) collection
+        segments = np.stack([target_points, gaze_points], axis=1)
+        ax.add_collection(LineCollection(segments, colors='k', alpha=0.3))
+        
+        ax.set_title('Simulated Calibration Results')
+        ax.set_xlabel('X Coordinate')
+        ax.set_ylabel('Y Coordinate')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        
+        # Convert plot to image
+        canvas = FigureCanvas(fig)
+        img_io = io.BytesIO()
+        canvas.print_png(img_io)
+        return base64.b64encode(img_io.getvalue()).decode('utf-8')
     
     def _check_psychopy(self):
         """Check if PsychoPy is available."""
-        try:
-            import psychopy
-            return True
-        except ImportError:
-            return False
+        if self._psychopy_available is None:
+            try:
+                import psychopy
+                self._psychopy_available = True
+            except ImportError:
+                self._psychopy_available = False
+        return self._psychopy_available
     
     def _check_local_modules(self):
         """Check if local modules are available."""
-        try:
-            from PsychoPyInterface.Scripts.gaze_tracking import GazeTracker
-            return True
-        except ImportError:
-            return False
+        if self._local_modules_available is None:
+            try:
+                from PsychoPyInterface.Scripts.gaze_tracking import GazeTracker
+                self._local_modules_available = True
+            except ImportError:
+                self._local_modules_available = False
+        return self._local_modules_available
     
     def _detect_webcams(self, max_cameras=10):
         """
@@ -330,30 +524,61 @@ class MinimalApp:
         """
         if not OPENCV_AVAILABLE:
             return []
-            
-        webcams = []
         
-        for i in range(max_cameras):
+        # Reuse a recent scan rather than reopening every device
+        now = time.monotonic()
+        if self._webcam_cache and now - self._webcam_cache[0] < WEBCAM_CACHE_TTL:
+            return self._webcam_cache[1]
+        
+        # Probe all indices concurrently; VideoCapture releases the GIL while
+        # the driver enumerates devices
+        with ThreadPoolExecutor(max_workers=max_cameras) as executor:
+            results = list(executor.map(self._probe_camera, range(max_cameras)))
+        
+        webcams = [webcam for webcam in results if webcam]
+        self._webcam_cache = (now, webcams)
+        return webcams
+    
+    def _probe_camera(self, index):
+        """
+        Probe a single webcam.
+        
+        Parameters:
+        -----------
+        index : int
+            Camera index to open
+            
+        Returns:
+        --------
+        dict or None
+            Webcam information, or None if no working camera was found
+        """
+        try:
+            cap = cv2.VideoCapture(index)
             try:
-                cap = cv2.VideoCapture(i)
                 if cap.isOpened():
-                    ret, frame = cap.read()
-                    if ret:
+                    # Only grab a frame if the backend does not report a
+                    # resolution without one
+                    width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+                    ret = width > 0
+                    if not ret:
+                        ret, frame = cap.read()
                         width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+                    if ret:
                         height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
                         fps = cap.get(cv2.CAP_PROP_FPS)
                         
-                        webcams.append({
-                            'id': i,
-                            'name': f'Camera {i}',
+                        return {
+                            'id': index,
+                            'name': f'Camera {index}',
                             'resolution': f'{int(width)}x{int(height)}',
                             'fps': int(fps) if fps > 0 else 'Unknown'
-                        })
+                        }
+            finally:
                 cap.release()
-            except Exception as e:
-                logger.debug(f"Error checking camera {i}: {e}")
-        
-        return webcams
+        except Exception as e:
+            logger.debug(f"Error checking camera {index}: {e}")
+        return None
     
     def run_web_interface(self):
         """Start the web interface."""
@@ -367,25 +592,26 @@ class MinimalApp:
             debug = self.config["web_interface"]["debug"]
             open_browser = self.config["web_interface"]["open_browser"]
             
-            # Check if port is available
-            if not self._is_port_available(host, port):
-                # Try to find an available port
-                for p in range(port + 1, port + 100):
-                    if self._is_port_available(host, p):
-                        logger.warning(f"Port {port} is not available. Using port {p} instead.")
-                        port = p
-                        break
-                else:
-                    logger.error(f"Could not find an available port. Web interface will not start.")
-                    return False
+            # Use the configured port, or the next available one
+            free_port = self._first_free_port(host, port, port + 100)
+            if free_port is None:
+                logger.error(f"Could not find an available port. Web interface will not start.")
+                return False
+            if free_port != port:
+                logger.warning(f"Port {port} is not available. Using port {free_port} instead.")
+                port = free_port
             
             # Open browser in a separate thread if requested
             if open_browser:
                 threading.Timer(1.5, lambda: webbrowser.open(f"http://{host}:{port}")).start()
             
-            # Start Flask app
+            # Start Flask app, under the threaded waitress server unless debugging
             logger.info(f"Starting web interface at http://{host}:{port}")
-            self.flask_app.run(host=host, port=port, debug=debug, use_reloader=False)
+            if WAITRESS_AVAILABLE and not debug:
+                waitress.serve(self.flask_app, host=host, port=port, threads=8)
+            else:
+                self.flask_app.run(host=host, port=port, debug=debug, use_reloader=False,
+                                   threaded=True)
             
             return True
             
@@ -394,15 +620,39 @@ class MinimalApp:
             logger.error(traceback.format_exc())
             return False
     
-    def _is_port_available(self, host, port):
-        """Check if a port is available."""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.bind((host, port))
-            sock.close()
-            return True
-        except:
-            return False
+    def _first_free_port(self, host, start, stop):
+        """
+        Find the first port in a range that can be bound.
+        
+        Parameters:
+        -----------
+        host : str
+            Host address to bind
+        start : int
+            First port to try
+        stop : int
+            End of the port range (exclusive)
+            
+        Returns:
+        --------
+        int or None
+            The first available port, or None if the whole range is taken
+        """
+        # One socket for the whole scan; a failed bind leaves it reusable
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            # On Windows SO_REUSEADDR lets bind() succeed on a port another process
+            # is listening on; SO_EXCLUSIVEADDRUSE makes busy ports fail as intended
+            if os.name == 'nt':
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+            else:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            for port in range(start, stop):
+                try:
+                    sock.bind((host, port))
+                    return port
+                except OSError:
+                    continue
+        return None
 
 def load_config_file(config_path):
     """
@@ -419,8 +669,8 @@ def load_config_file(config_path):
         Configuration dictionary or None if loading fails
     """
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        with open(config_path, 'rb') as f:
+            return _json_loads(f.read())
     except Exception as e:
         logger.error(f"Error loading configuration file: {str(e)}")
         return None
@@ -440,19 +690,20 @@ def main():
     if args.config:
         config = load_config_file(args.config)
     
-    if config is None:
-        config = DEFAULT_CONFIG.copy()
+    # Create application; an invalid configuration file stops here rather
+    # than running with settings the user did not ask for
+    try:
+        app = MinimalApp(config)
+    except ValueError as e:
+        parser.error(f"invalid configuration file {args.config}: {e}")
     
     # Override config with command line arguments
     if args.host:
-        config["web_interface"]["host"] = args.host
+        app.config["web_interface"]["host"] = args.host
     if args.port:
-        config["web_interface"]["port"] = args.port
+        app.config["web_interface"]["port"] = args.port
     if args.no_browser:
-        config["web_interface"]["open_browser"] = False
-    
-    # Create and run application
-    app = MinimalApp(config)
+        app.config["web_interface"]["open_browser"] = False
     
     try:
         # Run web interface
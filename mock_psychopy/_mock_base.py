@@ -2,17 +2,66 @@
 Base mock classes for the mock PsychoPy package.
 """
 
+import sys
+from typing import Any, Callable, Dict, List
+
+# Shared stand-ins for mocked functions, so building a mock module does not
+# create a new function object per attribute
+_NOOP: Callable[..., None] = lambda *args, **kwargs: None
+_ZERO_F: Callable[..., float] = lambda *args, **kwargs: 0.0
+_EMPTY_LIST: Callable[..., List[Any]] = lambda *args, **kwargs: []
+_EMPTY_DICT: Callable[..., Dict[Any, Any]] = lambda *args, **kwargs: {}
+
 class _MockModule:
-    def __init__(self, **kwargs):
+    __slots__ = ('__dict__',)
+    
+    def __init__(self, **kwargs: Any) -> None:
+        # Kept for existing callers; prefer _from_dict for new mocks
         for key, value in kwargs.items():
             setattr(self, key, value)
+    
+    @classmethod
+    def _from_dict(cls, attributes: Dict[str, Any]) -> "_MockModule":
+        """Build a mock module whose namespace holds the given attributes."""
+        obj = object.__new__(cls)
+        # Interned names hash once and compare by identity on lookup; string
+        # literals already are, but keys built at runtime may not be
+        obj.__dict__ = {sys.intern(name): value for name, value in attributes.items()}
+        return obj
 
 class _MockClass:
-    def __init__(self, *args, **kwargs):
-        pass
+    __slots__ = ()
+    
+    def __new__(cls, *args: Any, **kwargs: Any) -> "_MockClass":
+        # Mocks are stateless, so constructing one hands back the shared
+        # instance (created below with object.__new__) instead of allocating
+        return _SENTINEL
     
-    def __call__(self, *args, **kwargs):
-        return self
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        return
     
-    def __getattr__(self, name):
-        return _MockClass() 
\ No newline at end of file
+    def __call__(self, *args: Any, **kwargs: Any) -> "_MockClass":
+        return _SENTINEL
+    
+    def __getattr__(self, name: str) -> "_MockClass":
+        # Every missing attribute resolves to one shared instance
+        return _SENTINEL
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        # No per-instance state; assignments such as stim.pos = ... are ignored
+        return
+
+_SENTINEL: _MockClass = object.__new__(_MockClass)
+
+# Frequently used PsychoPy attribute names, installed on the class so lookups
+# hit the type dict instead of falling through to __getattr__
+_COMMON_ATTRIBUTES = (
+    'draw', 'flip', 'close', 'reset', 'show', 'getTime', 'getPos', 'getPressed',
+    'setPos', 'setSize', 'setColor', 'setText', 'setOri', 'setOpacity',
+    'setImage', 'setAutoDraw', 'setMouseVisible', 'setVisible', 'clearEvents',
+    'addData', 'nextEntry', 'saveAsWideText', 'saveAsPickle',
+    'pos', 'size', 'text', 'color', 'ori', 'opacity', 'units', 'status',
+)
+for _name in _COMMON_ATTRIBUTES:
+    setattr(_MockClass, _name, _SENTINEL)
+del _name
@@ -2,64 +2,104 @@
 Mock psychopy package
 """
 
-# Import submodules
-from . import hardware
+import importlib.util
+import os
+import sys
 
-# Create helper classes
-class _MockModule:
-    def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+def _load_mock_base():
+    """
+    Load mock_psychopy/_mock_base.py without running the mock_psychopy package
+    init, which mirrors the real psychopy init and imports its preferences.
 
-class _MockClass:
-    def __init__(self, *args, **kwargs):
-        pass
-    
-    def __call__(self, *args, **kwargs):
-        return self
-    
-    def __getattr__(self, name):
-        return _MockClass()
+    The module is registered as a private submodule of this package, so it
+    cannot be mistaken for mock_psychopy._mock_base when that package is
+    imported normally.
+    """
+    name = __name__ + '._mock_base'
+    module = sys.modules.get(name)
+    if module is None:
+        path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '_mock_base.py')
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return module
 
-# Create core module
-core = _MockModule(
-    getTime=lambda: 0.0,
-    wait=lambda x: None,
-    Clock=_MockClass,
-    CountdownTimer=_MockClass,
-    StaticPeriod=_MockClass,
-    quit=lambda: None,
-)
+# Share the mock classes with the rest of mock_psychopy
+_base = _load_mock_base()
+_MockModule = _base._MockModule
+_MockClass = _base._MockClass
+_SENTINEL = _base._SENTINEL
+_NOOP = _base._NOOP
+_ZERO_F = _base._ZERO_F
+_EMPTY_LIST = _base._EMPTY_LIST
+_EMPTY_DICT = _base._EMPTY_DICT
 
-# Create visual module
-visual = _MockModule(
-    Window=_MockClass,
-    TextStim=_MockClass,
-    ImageStim=_MockClass,
-    GratingStim=_MockClass,
-    ShapeStim=_MockClass,
-    Rect=_MockClass,
-    Circle=_MockClass,
-    Line=_MockClass,
-)
+# Mock submodules are built on first attribute access (PEP 562)
+def _build_core():
+    return _MockModule._from_dict({
+        'getTime': _ZERO_F,
+        'wait': _NOOP,
+        'Clock': _MockClass,
+        'CountdownTimer': _MockClass,
+        'StaticPeriod': _MockClass,
+        'quit': _NOOP,
+    })
 
-# Create event module
-event = _MockModule(
-    getKeys=lambda keyList=None: [],
-    waitKeys=lambda keyList=None: [],
-    Mouse=_MockClass,
-    clearEvents=lambda: None,
-)
+def _build_visual():
+    return _MockModule._from_dict({
+        'Window': _MockClass,
+        'TextStim': _MockClass,
+        'ImageStim': _MockClass,
+        'GratingStim': _MockClass,
+        'ShapeStim': _MockClass,
+        'Rect': _MockClass,
+        'Circle': _MockClass,
+        'Line': _MockClass,
+    })
 
-# Create data module
-data = _MockModule(
-    ExperimentHandler=_MockClass,
-    TrialHandler=_MockClass,
-    MultiStairHandler=_MockClass,
-)
+def _build_event():
+    return _MockModule._from_dict({
+        'getKeys': _EMPTY_LIST,
+        'waitKeys': _EMPTY_LIST,
+        'Mouse': _MockClass,
+        'clearEvents': _NOOP,
+    })
 
-# Create gui module
-gui = _MockModule(
-    Dlg=_MockClass,
-    DlgFromDict=_MockClass,
-)
+def _build_data():
+    return _MockModule._from_dict({
+        'ExperimentHandler': _MockClass,
+        'TrialHandler': _MockClass,
+        'MultiStairHandler': _MockClass,
+    })
+
+def _build_gui():
+    return _MockModule._from_dict({
+        'Dlg': _MockClass,
+        'DlgFromDict': _MockClass,
+    })
+
+def _build_hardware():
+    # A real subpackage, imported on first use rather than with the package
+    return importlib.import_module('.hardware', __name__)
+
+_LAZY = {
+    'core': _build_core,
+    'visual': _build_visual,
+    'event': _build_event,
+    'data': _build_data,
+    'gui': _build_gui,
+    'hardware': _build_hardware,
+}
+
+def __getattr__(name):
+    factory = _LAZY.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory()
+    # Cache in the module namespace so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
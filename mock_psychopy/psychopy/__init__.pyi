@@ -0,0 +1,35 @@
+"""
+Type stub for the mock psychopy package
+
+Declares the lazily built submodules so IDEs and type checkers can see
+them before first access.
+"""
+
+from typing import Any, Callable
+
+from . import hardware as hardware
+
+class _MockModule:
+    def __init__(self, **kwargs: Any) -> None: ...
+    @classmethod
+    def _from_dict(cls, attributes: dict[str, Any]) -> _MockModule: ...
+    def __getattr__(self, name: str) -> Any: ...
+
+class _MockClass:
+    def __init__(self, *args: Any, **kwargs: Any) -> None: ...
+    def __call__(self, *args: Any, **kwargs: Any) -> _MockClass: ...
+    def __getattr__(self, name: str) -> _MockClass: ...
+
+_NOOP: Callable[..., None]
+_ZERO_F: Callable[..., float]
+_EMPTY_LIST: Callable[..., list[Any]]
+_EMPTY_DICT: Callable[..., dict[Any, Any]]
+
+core: _MockModule
+visual: _MockModule
+event: _MockModule
+data: _MockModule
+gui: _MockModule
+
+def __getattr__(name: str) -> _MockModule: ...
+def __dir__() -> list[str]: ...
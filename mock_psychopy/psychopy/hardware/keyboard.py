@@ -5,6 +5,8 @@ Mock psychopy.hardware.keyboard module
 class Keyboard:
     """Mock Keyboard class"""
     
+    __slots__ = ()
+    
     def __init__(self, *args, **kwargs):
         pass
         
@@ -2,27 +2,35 @@
 Mock Tobii Research module for development and testing.
 """
 
-from ._mock_base import _MockModule, _MockClass
+from ._mock_base import _MockModule, _MockClass, _NOOP
 
 # Constants
 EYETRACKER_GAZE_DATA = "gaze_data"
 CALIBRATION_STATUS_SUCCESS = 1
 UNMASKED_RENDERER_WEBGL = 0x9246
 
+# Tracker list returned by find_all_eyetrackers, built on first call
+_EYETRACKERS_SINGLETON = None
+
 def find_all_eyetrackers():
     """Mock function to find Tobii eye trackers."""
-    return [
-        _MockModule(
-            model="Tobii Pro Spectrum",
-            serial_number="TS123456",
-            subscribe_to=lambda *args, **kwargs: None,
-            unsubscribe_from=lambda *args, **kwargs: None,
-        )
-    ]
+    global _EYETRACKERS_SINGLETON
+    if _EYETRACKERS_SINGLETON is None:
+        _EYETRACKERS_SINGLETON = [
+            _MockModule._from_dict({
+                "model": "Tobii Pro Spectrum",
+                "serial_number": "TS123456",
+                "subscribe_to": _NOOP,
+                "unsubscribe_from": _NOOP,
+            })
+        ]
+    return _EYETRACKERS_SINGLETON
 
 class ScreenBasedCalibration:
     """Mock class for Tobii screen-based calibration."""
     
+    __slots__ = ('tracker',)
+    
     def __init__(self, tracker):
         self.tracker = tracker
         
@@ -36,7 +44,7 @@ class ScreenBasedCalibration:
         
     def compute_and_apply(self):
         """Compute and apply calibration."""
-        return _MockModule(status=CALIBRATION_STATUS_SUCCESS)
+        return _MockModule._from_dict({"status": CALIBRATION_STATUS_SUCCESS})
         
     def leave_calibration_mode(self):
         """Leave calibration mode."""
@@ -10,6 +10,10 @@ import os
 import sys
 import logging
 import argparse
+import importlib.util
+from importlib.metadata import distribution, PackageNotFoundError
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Configure logging
@@ -19,51 +23,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger('app_launcher')
 
+# (import name, pip package, display name) for each dependency checked at startup
+DEPENDENCIES = [
+    ("flask", "flask", "Flask"),
+    ("flask_cors", "flask-cors", "Flask-CORS"),
+    ("psychopy", "psychopy", "PsychoPy"),
+    ("numpy", "numpy", "NumPy"),
+    ("matplotlib", "matplotlib", "Matplotlib"),
+    ("cv2", "opencv-python", "OpenCV"),
+]
+
+@lru_cache(maxsize=None)
+def _probe(module_name, package_name):
+    """Check whether a module is installed, without importing it."""
+    # Installed distribution metadata is the cheapest check; fall back to
+    # the import system for modules provided under another distribution
+    # name (e.g. cv2 from opencv-python-headless) or without metadata
+    try:
+        distribution(package_name)
+        return True
+    except PackageNotFoundError:
+        return importlib.util.find_spec(module_name) is not None
+
 def check_dependencies():
     """Check if required dependencies are installed."""
     missing_deps = []
     
-    try:
-        import flask
-        logger.info("Flask is installed")
-    except ImportError:
-        missing_deps.append("flask")
-        logger.error("Flask is not installed")
+    # Locate the modules without importing them (importing psychopy or cv2
+    # just to check for them costs hundreds of milliseconds at startup), and
+    # probe them concurrently since the lookups are independent
+    module_names = [module_name for module_name, _, _ in DEPENDENCIES]
+    package_names = [package_name for _, package_name, _ in DEPENDENCIES]
+    with ThreadPoolExecutor(max_workers=len(module_names)) as executor:
+        found = dict(zip(module_names, executor.map(_probe, module_names, package_names)))
     
-    try:
-        import flask_cors
-        logger.info("Flask-CORS is installed")
-    except ImportError:
-        missing_deps.append("flask-cors")
-        logger.error("Flask-CORS is not installed")
-    
-    try:
-        import psychopy
-        logger.info("PsychoPy is installed")
-    except ImportError:
-        missing_deps.append("psychopy")
-        logger.error("PsychoPy is not installed")
-    
-    try:
-        import numpy
-        logger.info("NumPy is installed")
-    except ImportError:
-        missing_deps.append("numpy")
-        logger.error("NumPy is not installed")
-    
-    try:
-        import matplotlib
-        logger.info("Matplotlib is installed")
-    except ImportError:
-        missing_deps.append("matplotlib")
-        logger.error("Matplotlib is not installed")
-    
-    try:
-        import cv2
-        logger.info("OpenCV is installed")
-    except ImportError:
-        missing_deps.append("opencv-python")
-        logger.error("OpenCV is not installed (webcam features will be limited)")
+    for module_name, package_name, display_name in DEPENDENCIES:
+        if found[module_name]:
+            logger.info(f"{display_name} is installed")
+        elif module_name == "cv2":
+            missing_deps.append(package_name)
+            logger.error(f"{display_name} is not installed (webcam features will be limited)")
+        else:
+            missing_deps.append(package_name)
+            logger.error(f"{display_name} is not installed")
     
     return missing_deps
 
@@ -74,9 +76,16 @@ def install_dependencies(missing_deps):
     
     logger.info(f"Installing missing dependencies: {', '.join(missing_deps)}")
     
+    # pip is run in a subprocess rather than in-process: pip.main is not a
+    # supported API and would mutate this interpreter's state. Skipping the
+    # version check avoids pip's extra network round trip.
+    env = os.environ.copy()
+    env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    
     try:
         import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing_deps)
+        subprocess.check_call([sys.executable, "-m", "pip", "install"] + missing_deps, env=env)
         logger.info("Dependencies installed successfully")
         return True
     except Exception as e:
@@ -108,20 +117,13 @@ def main():
     try:
         from PsychoPyInterface.run_application import main as run_app
         
-        # Run the application
-        sys.argv = [sys.argv[0]]  # Reset argv to avoid conflicts
-        
-        # Add arguments
-        if args.host:
-            sys.argv.extend(['--host', args.host])
-        if args.port:
-            sys.argv.extend(['--port', str(args.port)])
-        if args.no_browser:
-            sys.argv.append('--no-browser')
-        if args.tracker:
-            sys.argv.extend(['--tracker', args.tracker])
-        
-        run_app()
+        # Run the application with the options parsed here
+        run_app(
+            host=args.host,
+            port=args.port,
+            no_browser=args.no_browser,
+            tracker=args.tracker
+        )
     except ImportError as e:
         logger.error(f"Failed to import application module: {e}")
         logger.error("Make sure the PsychoPyInterface package is properly installed.")
@@ -40,6 +40,7 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "mypy>=1.0.0",
         ],
@@ -49,6 +50,8 @@ setup(
             "sqlalchemy>=2.0.0",
             "flask>=2.2.0",
             "flask-cors>=3.0.10",
+            "orjson>=3.9.0",
+            "waitress>=2.1.0",
         ],
     },
     entry_points={
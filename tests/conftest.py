@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Shared pytest configuration for the PsychoPy Gaze Tracking tests.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Make the PsychoPyInterface package importable once for all test modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Use the non-interactive backend so importing pyplot skips GUI backend
+# detection and needs no display; set through the environment so matplotlib
+# itself is only imported by the tests that use it
+os.environ.setdefault("MPLBACKEND", "Agg")
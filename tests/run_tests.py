@@ -4,18 +4,31 @@
 Test runner script for PsychoPy Gaze Tracking.
 """
 
+import importlib.util
 import unittest
 import sys
 from pathlib import Path
 
-# Add the parent directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 def run_all_tests():
     """Run all tests in the tests directory."""
+    tests_dir = Path(__file__).parent
+    
+    # Prefer pytest, spreading tests across CPU cores when pytest-xdist is
+    # installed; pytest runs the unittest-style test classes as they are
+    try:
+        import pytest
+    except ImportError:
+        pytest = None
+    
+    if pytest is not None:
+        args = [str(tests_dir), "-q"]
+        if importlib.util.find_spec("xdist") is not None:
+            args += ["-n", "auto"]
+        return int(pytest.main(args))
+    
     # Discover and run all tests
     test_loader = unittest.TestLoader()
-    test_suite = test_loader.discover(start_dir=str(Path(__file__).parent), pattern="test_*.py")
+    test_suite = test_loader.discover(start_dir=str(tests_dir), pattern="test_*.py")
     
     # Run the tests
     test_runner = unittest.TextTestRunner(verbosity=2)
@@ -25,4 +38,7 @@ def run_all_tests():
     return 0 if result.wasSuccessful() else 1
 
 if __name__ == "__main__":
+    # Add the parent directory to the path
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    
     sys.exit(run_all_tests()) 
\ No newline at end of file
@@ -4,16 +4,24 @@
 Test script for the PsychoPy interface.
 """
 
+import importlib.util
+import json
 import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
 # Add the parent directory to the path so we can import the PsychoPyInterface package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-try:
+PSYCHOPY_AVAILABLE = importlib.util.find_spec("psychopy") is not None
+
+if PSYCHOPY_AVAILABLE:
     # Test imports from PsychoPyInterface
+    from PsychoPyInterface.utils.eye_tracker import EyeTracker
     from PsychoPyInterface.utils.webgazer_bridge import WebGazerBridge
     
     # Only attempt to import these if the directory exists
@@ -23,29 +31,80 @@ try:
             from PsychoPyInterface.experiments.webgazer_demo import WebGazerDemo
         except ImportError as e:
             print(f"Warning: Could not import experiment modules: {e}")
+
+
+@unittest.skipUnless(PSYCHOPY_AVAILABLE, "psychopy is not installed")
+class TestPsychoPyInterface(unittest.TestCase):
+    """Test cases for PsychoPy interface."""
+    
+    def test_webgazer_bridge_init(self):
+        """Test WebGazerBridge initialization."""
+        bridge = WebGazerBridge(session_id="test_session")
+        self.assertEqual(bridge.session_id, "test_session")
+        self.assertEqual(bridge.host, "localhost")
+        self.assertFalse(bridge.is_running)
+    
+    def test_webgazer_bridge_latest_gaze_data(self):
+        """Test WebGazerBridge latest gaze data before any client connects."""
+        bridge = WebGazerBridge(session_id="test_session")
+        self.assertFalse(bridge.is_connected())
+        self.assertIsNone(bridge.get_latest_gaze_data())
+    
+    def test_webgazer_bridge_html(self):
+        """Test WebGazerBridge HTML generation."""
+        bridge = WebGazerBridge(session_id="test_session")
+        html = bridge.get_client_html()
+        self.assertIsInstance(html, str)
+        self.assertIn("WebGazer", html)
+        self.assertIn("websocket", html)
     
-    class TestPsychoPyInterface(unittest.TestCase):
-        """Test cases for PsychoPy interface."""
+    def test_webgazer_bridge_html_cached(self):
+        """Test WebGazerBridge reuses the client HTML until the address changes."""
+        bridge = WebGazerBridge(session_id="test_session")
+        html = bridge.get_client_html()
+        self.assertIs(bridge.get_client_html(), html)
         
-        def test_webgazer_bridge_init(self):
-            """Test WebGazerBridge initialization."""
-            bridge = WebGazerBridge(session_id="test_session")
-            self.assertEqual(bridge.session_id, "test_session")
-            self.assertEqual(bridge.host, "localhost")
-            self.assertFalse(bridge.is_running)
+        bridge.port = 9876
+        self.assertIn("9876", bridge.get_client_html())
+    
+    def test_webgazer_recording_skips_earlier_samples(self):
+        """Test a new recording only keeps WebGazer samples received after it starts."""
+        with tempfile.TemporaryDirectory() as data_dir, \
+                mock.patch.object(EyeTracker, '_initialize_tracker'):
+            tracker = EyeTracker(SimpleNamespace(size=(800, 600)), tracker_type='webgazer',
+                                 data_dir=data_dir, stream_to_disk=False)
+        
+        bridge = WebGazerBridge(session_id="test_session", save_locally=False)
+        for i in range(1000):
+            bridge._append_record(float(i), 0.5, 0.5)
+        tracker.tracker = bridge
+        
+        tracker.start_recording()
+        bridge._append_record(1000.0, 0.25, 0.75)
+        tracker.update()
         
-        def test_webgazer_bridge_html(self):
-            """Test WebGazerBridge HTML generation."""
-            bridge = WebGazerBridge(session_id="test_session")
-            html = bridge.get_client_html()
-            self.assertIsInstance(html, str)
-            self.assertIn("WebGazer", html)
-            self.assertIn("websocket", html)
+        self.assertEqual(len(tracker.gaze_data), 1)
+        self.assertEqual(tracker.gaze_data[0]['timestamp'], 1000.0)
     
-    if __name__ == "__main__":
-        unittest.main()
+    def test_webgazer_missing_coordinates_saved_as_null(self):
+        """Test WebGazer samples without coordinates are saved as valid JSON."""
+        with tempfile.TemporaryDirectory() as data_dir:
+            with mock.patch.object(EyeTracker, '_initialize_tracker'):
+                tracker = EyeTracker(SimpleNamespace(size=(800, 600)), tracker_type='webgazer',
+                                     data_dir=data_dir, stream_to_disk=False)
+            tracker.tracker = WebGazerBridge(session_id="test_session", save_locally=False)
+            
+            tracker.start_recording()
+            tracker.tracker._append_record(1.0, None, None)
+            tracker.update()
+            self.assertIsNone(tracker.get_gaze_position())
+            
+            with open(tracker.save_data()) as f:
+                saved = json.loads(f.read(), parse_constant=self.fail)
+        
+        self.assertIsNone(saved['gaze_data'][0]['x'])
+        self.assertIsNone(saved['gaze_data'][0]['y'])
+
 
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Make sure you have activated the virtual environment and installed all dependencies.")
-    print("Run: source venv/bin/activate && pip install -r requirements.txt") 
\ No newline at end of file
+if __name__ == "__main__":
+    unittest.main()